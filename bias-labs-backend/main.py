@@ -1,110 +1,256 @@
-from fastapi import FastAPI, HTTPException, Query
+from fastapi import FastAPI, HTTPException, Query, Response
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse
-from pydantic import BaseModel
-from typing import List, Optional, Dict, Any
-from datetime import datetime, timedelta
+from fastapi.responses import ORJSONResponse
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+from typing import List, Optional, Dict, Any, Iterable
+from datetime import datetime
 import uvicorn
-import random
-import uuid
+from functools import lru_cache
+from collections import Counter
+from itertools import islice
+import hashlib
+import time
+import orjson
 
 # Import our models and mock data
-from models import Article, Narrative, ArticleSummary, NarrativeSummary, BiasScores, TimePoint
+from models import Article, Narrative, ArticleSummary, NarrativeSummary, TimePoint
 from mock_data import (
     get_all_articles, 
+    get_recent_articles,
     get_article_by_id, 
+    get_articles_by_narrative_id,
     get_all_narratives, 
-    get_narrative_by_id,
-    MOCK_ARTICLES,
-    MOCK_NARRATIVES
+    get_recent_narratives,
+    get_narrative_by_id
 )
 
+# Bumped whenever the underlying data changes so cached aggregates are recomputed.
+# Mock data is static, so this never moves in the prototype.
+_DATA_VERSION = 0
+
 # Initialize FastAPI app
 app = FastAPI(
     title="Bias Labs API",
     description="API for media bias analysis and narrative clustering",
-    version="1.0.0"
+    version="1.0.0",
+    default_response_class=ORJSONResponse  # orjson serializes datetimes and nested models in C
 )
 
 # Configure CORS for React frontend
 app.add_middleware(
     CORSMiddleware,
-    allow_origins=["http://localhost:3000", "http://127.0.0.1:3000", "*"],  # React dev server + deployed
+    # React dev server + deployed frontend. No "*": a wildcard is invalid alongside credentials.
+    allow_origins=["http://localhost:3000", "http://127.0.0.1:3000", "https://bias-lab-prototype.vercel.app"],
+    # Other local dev ports (compiled once by Starlette). Vercel preview origins are
+    # not matched by pattern: any account can claim bias-lab-prototype-* project
+    # names, so add preview URLs to allow_origins explicitly if needed.
+    allow_origin_regex=r"https?://(localhost|127\.0\.0\.1)(:\d+)?",
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
 )
 
+# Listing endpoints that support conditional GETs via ETag / If-None-Match
+_ETAG_PATHS = {"/articles", "/narratives", "/stats"}
+
+def _etag_matches(if_none_match: str, etag: str) -> bool:
+    """Weak If-None-Match comparison: "*" matches anything and W/ prefixes are ignored"""
+    for tag in if_none_match.split(","):
+        tag = tag.strip()
+        if tag == "*" or tag.removeprefix("W/") == etag:
+            return True
+    return False
+
+class ETagMiddleware:
+    """Tag listing responses with a content hash and answer matching polls with 304.
+
+    Plain ASGI rather than @app.middleware("http"): every other path is handed
+    straight to the app without BaseHTTPMiddleware's per-request overhead.
+    """
+    
+    def __init__(self, app: ASGIApp):
+        self.app = app
+    
+    async def __call__(self, scope: Scope, receive: Receive, send: Send):
+        if scope["type"] != "http" or scope["method"] != "GET" or scope["path"] not in _ETAG_PATHS:
+            await self.app(scope, receive, send)
+            return
+        
+        start_message: Optional[Message] = None
+        body_parts: List[bytes] = []
+        
+        async def send_with_etag(message: Message):
+            nonlocal start_message
+            if message["type"] == "http.response.start":
+                if message["status"] != 200:
+                    await send(message)
+                else:
+                    start_message = message
+                return
+            if start_message is None or message["type"] != "http.response.body":
+                await send(message)
+                return
+            
+            body_parts.append(message.get("body", b""))
+            if message.get("more_body", False):
+                return
+            
+            body = b"".join(body_parts)
+            # Non-cryptographic use: blake2b with a short digest is fast and ships with Python
+            etag = f'"{hashlib.blake2b(body, digest_size=8).hexdigest()}"'
+            
+            # Edits the raw header list in place, so repeated headers are preserved
+            headers = MutableHeaders(scope=start_message)
+            headers["etag"] = etag
+            
+            if_none_match = Headers(scope=scope).get("if-none-match")
+            if if_none_match and _etag_matches(if_none_match, etag):
+                del headers["content-length"]
+                del headers["content-type"]
+                start_message["status"] = 304
+                body = b""
+            
+            await send(start_message)
+            await send({"type": "http.response.body", "body": body})
+        
+        await self.app(scope, receive, send_with_etag)
+
+app.add_middleware(ETagMiddleware)
+
+# ArticleSummary projections keyed by article ID (articles are immutable mock data)
+_SUMMARY_CACHE: Dict[str, ArticleSummary] = {}
+
 # Helper function to ensure consistent ArticleSummary conversion
 def article_to_summary(article: Article) -> ArticleSummary:
     """Convert Article to ArticleSummary ensuring data consistency"""
-    return ArticleSummary(
-        id=article.id,
-        title=article.title,
-        source=article.source,
-        published_date=article.published_date,
-        bias_scores=article.bias_scores,  # Use exact same bias_scores object
-        narrative_id=article.narrative_id
-    )
+    summary = _SUMMARY_CACHE.get(article.id)
+    if summary is None:
+        # Fields come from an already-validated Article, so skip re-validation
+        summary = ArticleSummary.model_construct(
+            id=article.id,
+            title=article.title,
+            source=article.source,
+            published_date=article.published_date,
+            bias_scores=article.bias_scores,  # Use exact same bias_scores object
+            narrative_id=article.narrative_id
+        )
+        _SUMMARY_CACHE[article.id] = summary
+    return summary
+
+# Dumped ArticleSummary dicts keyed by article ID, serialized as-is by the listing
+# routes. Shared across requests, so treat them as read-only.
+_SUMMARY_DICT_CACHE: Dict[str, Dict[str, Any]] = {}
+
+def article_to_summary_dict(article: Article) -> Dict[str, Any]:
+    """ArticleSummary for an article, already dumped for direct serialization"""
+    summary_dict = _SUMMARY_DICT_CACHE.get(article.id)
+    if summary_dict is None:
+        summary_dict = article_to_summary(article).model_dump()
+        _SUMMARY_DICT_CACHE[article.id] = summary_dict
+    return summary_dict
+
+# Warm the summary caches so the first listing request doesn't pay for them
+for _article in get_all_articles():
+    article_to_summary_dict(_article)
+
+# Health timestamp, reformatted at most once per second under frequent liveness probes.
+# Stored as one (ts, iso) tuple and swapped in a single assignment, so threadpool
+# callers never see a fresh ts paired with a stale or empty iso.
+_health_stamp = (0.0, "")
+
+def _iso_now() -> str:
+    global _health_stamp
+    now = time.time()
+    ts, iso = _health_stamp
+    if now - ts >= 1.0:
+        iso = datetime.fromtimestamp(now).isoformat()
+        _health_stamp = (now, iso)
+    return iso
+
+# /health payload prebuilt as JSON bytes, split around the timestamp so each
+# request only stitches in the current value
+_HEALTH_TIMESTAMP_SENTINEL = "__timestamp__"
+_HEALTH_HEAD, _HEALTH_TAIL = orjson.dumps({
+    "status": "healthy",
+    "timestamp": _HEALTH_TIMESTAMP_SENTINEL,
+    "service": "Bias Labs API",
+    "version": "1.0.0",
+    "data_stats": {
+        "total_articles": len(get_all_articles()),
+        "total_narratives": len(get_all_narratives())
+    }
+}).split(_HEALTH_TIMESTAMP_SENTINEL.encode())
+
+# Constant / payload, serialized once
+_ROOT_BYTES = orjson.dumps({
+    "message": "Welcome to Bias Labs API",
+    "docs": "/docs",
+    "health": "/health",
+    "endpoints": {
+        "articles": "/articles",
+        "narratives": "/narratives"
+    }
+})
 
 # Health check endpoint
 @app.get("/health")
-async def health_check():
-    return {
-        "status": "healthy",
-        "timestamp": datetime.now().isoformat(),
-        "service": "Bias Labs API",
-        "version": "1.0.0",
-        "data_stats": {
-            "total_articles": len(MOCK_ARTICLES),
-            "total_narratives": len(MOCK_NARRATIVES)
-        }
-    }
+def health_check():
+    return Response(_HEALTH_HEAD + _iso_now().encode() + _HEALTH_TAIL, media_type="application/json")
 
 # Root endpoint
 @app.get("/")
-async def root():
-    return {
-        "message": "Welcome to Bias Labs API",
-        "docs": "/docs",
-        "health": "/health",
-        "endpoints": {
-            "articles": "/articles",
-            "narratives": "/narratives"
-        }
-    }
+def root():
+    return Response(_ROOT_BYTES, media_type="application/json")
+
+# /articles filter variants, one per combination of (bias_threshold, narrative_id).
+# Narrative filters are served straight from the narrative index. Both sources are
+# pre-sorted by publication date (most recent first), so filtering keeps that order,
+# and threshold filters are lazy so pagination can stop once the page is full.
+def _filter_none(bias_threshold: Optional[float], narrative_id: Optional[str]) -> Iterable[Article]:
+    return get_recent_articles()
+
+def _filter_bias(bias_threshold: Optional[float], narrative_id: Optional[str]) -> Iterable[Article]:
+    return (a for a in get_recent_articles() if a.bias_scores.overall >= bias_threshold)
+
+def _filter_narrative(bias_threshold: Optional[float], narrative_id: Optional[str]) -> Iterable[Article]:
+    return get_articles_by_narrative_id(narrative_id)
+
+def _filter_both(bias_threshold: Optional[float], narrative_id: Optional[str]) -> Iterable[Article]:
+    return (a for a in get_articles_by_narrative_id(narrative_id) if a.bias_scores.overall >= bias_threshold)
+
+_ARTICLE_FILTERS = {
+    (False, False): _filter_none,
+    (True, False): _filter_bias,
+    (False, True): _filter_narrative,
+    (True, True): _filter_both,
+}
 
 # Articles endpoints
-@app.get("/articles", response_model=List[ArticleSummary])
-async def get_articles(
+# Summaries are built from validated models, so these routes skip response_model
+# re-validation and serialize directly; `responses` keeps the OpenAPI schema.
+@app.get("/articles", responses={200: {"model": List[ArticleSummary]}})
+def get_articles(
     limit: int = Query(10, description="Maximum number of articles to return", ge=1, le=50),
     offset: int = Query(0, description="Number of articles to skip", ge=0),
     bias_threshold: Optional[float] = Query(None, description="Filter articles above this bias threshold", ge=0, le=100),
     narrative_id: Optional[str] = Query(None, description="Filter articles by narrative ID")
 ):
     """Get list of articles with basic information and bias scores"""
-    articles = get_all_articles()
-    
-    # Apply filters
-    if bias_threshold is not None:
-        articles = [a for a in articles if a.bias_scores.overall >= bias_threshold]
-    
-    if narrative_id is not None:
-        articles = [a for a in articles if a.narrative_id == narrative_id]
-    
-    # Sort by publication date (most recent first)
-    articles = sorted(articles, key=lambda x: x.published_date, reverse=True)
+    # Apply filters via the specialized variant for this combination of parameters
+    article_filter = _ARTICLE_FILTERS[(bias_threshold is not None, narrative_id is not None)]
+    articles = article_filter(bias_threshold, narrative_id)
     
     # Apply pagination
-    paginated_articles = articles[offset:offset + limit]
+    paginated_articles = islice(articles, offset, offset + limit)
     
     # Convert to ArticleSummary format using helper function
-    article_summaries = [article_to_summary(article) for article in paginated_articles]
+    article_summaries = [article_to_summary_dict(article) for article in paginated_articles]
     
-    return article_summaries
+    return ORJSONResponse(article_summaries)
 
 @app.get("/articles/{article_id}", response_model=Article)
-async def get_article_detail(article_id: str):
+def get_article_detail(article_id: str):
     """Get detailed article with bias analysis and highlighted phrases"""
     article = get_article_by_id(article_id)
     
@@ -114,31 +260,31 @@ async def get_article_detail(article_id: str):
     return article
 
 # Narratives endpoints
-@app.get("/narratives", response_model=List[NarrativeSummary])
-async def get_narratives():
+# Like the article listings, summaries come from validated models, so this route
+# skips response_model re-validation and serializes the dumped dicts directly.
+@app.get("/narratives", responses={200: {"model": List[NarrativeSummary]}})
+def get_narratives():
     """Get list of narrative clusters with summary information"""
-    narratives = get_all_narratives()
+    # Already sorted by last updated (most recent first)
+    narratives = get_recent_narratives()
     
-    # Sort by last updated (most recent first)
-    narratives = sorted(narratives, key=lambda x: x.last_updated, reverse=True)
-    
-    # Convert to NarrativeSummary format
+    # Convert to NarrativeSummary format (trusted fields, so skip re-validation)
     narrative_summaries = [
-        NarrativeSummary(
+        NarrativeSummary.model_construct(
             id=narrative.id,
             title=narrative.title,
             description=narrative.description,
             article_count=narrative.article_count,
             avg_bias_scores=narrative.avg_bias_scores,
             last_updated=narrative.last_updated
-        )
+        ).model_dump()
         for narrative in narratives
     ]
     
-    return narrative_summaries
+    return ORJSONResponse(narrative_summaries)
 
 @app.get("/narratives/{narrative_id}", response_model=Narrative)
-async def get_narrative_detail(narrative_id: str):
+def get_narrative_detail(narrative_id: str):
     """Get detailed narrative with all associated articles and bias evolution"""
     narrative = get_narrative_by_id(narrative_id)
     
@@ -148,7 +294,7 @@ async def get_narrative_detail(narrative_id: str):
     return narrative
 
 @app.get("/narratives/{narrative_id}/timeline", response_model=List[TimePoint])
-async def get_narrative_timeline(narrative_id: str):
+def get_narrative_timeline(narrative_id: str):
     """Get bias evolution timeline for a specific narrative"""
     narrative = get_narrative_by_id(narrative_id)
     
@@ -157,73 +303,85 @@ async def get_narrative_timeline(narrative_id: str):
     
     return narrative.bias_evolution
 
-@app.get("/narratives/{narrative_id}/articles", response_model=List[ArticleSummary])
-async def get_narrative_articles(narrative_id: str):
+@app.get("/narratives/{narrative_id}/articles", responses={200: {"model": List[ArticleSummary]}})
+def get_narrative_articles(narrative_id: str):
     """Get all articles belonging to a specific narrative"""
     narrative = get_narrative_by_id(narrative_id)
     
     if not narrative:
         raise HTTPException(status_code=404, detail=f"Narrative with ID {narrative_id} not found")
     
-    # Get articles for this narrative - using get_article_by_id to ensure consistency
-    narrative_articles = []
-    for article_id in narrative.article_ids:
-        article = get_article_by_id(article_id)
-        if article:
-            narrative_articles.append(article)
-    
-    # Sort by publication date
-    narrative_articles = sorted(narrative_articles, key=lambda x: x.published_date, reverse=True)
+    # Get articles for this narrative from the prebuilt narrative index
+    # (already sorted by publication date, most recent first)
+    narrative_articles = get_articles_by_narrative_id(narrative_id)
     
     # Convert to ArticleSummary format using helper function
-    article_summaries = [article_to_summary(article) for article in narrative_articles]
+    article_summaries = [article_to_summary_dict(article) for article in narrative_articles]
     
-    return article_summaries
+    return ORJSONResponse(article_summaries)
 
-# Statistics endpoint for dashboard overview
-@app.get("/stats")
-async def get_statistics():
-    """Get overall statistics about bias analysis data"""
+@lru_cache(maxsize=1)
+def _compute_stats(version: int) -> Dict[str, Any]:
+    """Aggregate statistics for a given data version (memoized per version)"""
     articles = get_all_articles()
     narratives = get_all_narratives()
     
     if not articles:
         return {"error": "No articles available"}
     
-    # Calculate average bias scores across all articles for the 5 correct dimensions
-    avg_overall_bias = sum(a.bias_scores.overall for a in articles) / len(articles)
-    avg_ideological_stance = sum(a.bias_scores.ideological_stance for a in articles) / len(articles)
-    avg_factual_grounding = sum(a.bias_scores.factual_grounding for a in articles) / len(articles)
-    avg_framing_choices = sum(a.bias_scores.framing_choices for a in articles) / len(articles)
-    avg_emotional_tone = sum(a.bias_scores.emotional_tone for a in articles) / len(articles)
-    avg_source_transparency = sum(a.bias_scores.source_transparency for a in articles) / len(articles)
-    
-    # Source distribution
-    source_counts = {}
+    # Single pass over articles: accumulate all bias dimensions and the date range
+    sum_overall = sum_ideological = sum_factual = sum_framing = sum_emotional = sum_transparency = 0.0
+    earliest = latest = articles[0].published_date
     for article in articles:
-        source_counts[article.source] = source_counts.get(article.source, 0) + 1
+        scores = article.bias_scores
+        sum_overall += scores.overall
+        sum_ideological += scores.ideological_stance
+        sum_factual += scores.factual_grounding
+        sum_framing += scores.framing_choices
+        sum_emotional += scores.emotional_tone
+        sum_transparency += scores.source_transparency
+        
+        published = article.published_date
+        if published < earliest:
+            earliest = published
+        if published > latest:
+            latest = published
+    
+    # Source distribution (Counter does the tallying in C)
+    source_counts = dict(Counter(a.source for a in articles))
+    
+    n = len(articles)
     
     return {
-        "total_articles": len(articles),
+        "total_articles": n,
         "total_narratives": len(narratives),
         "average_bias_scores": {
-            "overall": round(avg_overall_bias, 1),
-            "ideological_stance": round(avg_ideological_stance, 1),
-            "factual_grounding": round(avg_factual_grounding, 1),
-            "framing_choices": round(avg_framing_choices, 1),
-            "emotional_tone": round(avg_emotional_tone, 1),
-            "source_transparency": round(avg_source_transparency, 1)
+            "overall": round(sum_overall / n, 1),
+            "ideological_stance": round(sum_ideological / n, 1),
+            "factual_grounding": round(sum_factual / n, 1),
+            "framing_choices": round(sum_framing / n, 1),
+            "emotional_tone": round(sum_emotional / n, 1),
+            "source_transparency": round(sum_transparency / n, 1)
         },
         "source_distribution": source_counts,
         "time_range": {
-            "earliest_article": min(a.published_date for a in articles).isoformat(),
-            "latest_article": max(a.published_date for a in articles).isoformat()
+            "earliest_article": earliest.isoformat(),
+            "latest_article": latest.isoformat()
         }
     }
 
+# Precompute stats for the current data at import so no request pays for the aggregation
+_compute_stats(_DATA_VERSION)
+
+# Statistics endpoint for dashboard overview
+@app.get("/stats")
+def get_statistics():
+    """Get overall statistics about bias analysis data"""
+    return _compute_stats(_DATA_VERSION)
+
 # Debug endpoint to check data consistency
 @app.get("/debug/article/{article_id}")
-async def debug_article_consistency(article_id: str):
+def debug_article_consistency(article_id: str):
     """Debug endpoint to check if article data is consistent across endpoints"""
     
     # Get article directly
@@ -231,37 +389,41 @@ async def debug_article_consistency(article_id: str):
     if not article:
         raise HTTPException(status_code=404, detail="Article not found")
     
-    # Find which narrative this article belongs to
-    narrative = None
-    for n in get_all_narratives():
-        if article_id in n.article_ids:
-            narrative = n
-            break
+    # Find which narrative this article belongs to (O(1) by ID, then confirm membership)
+    narrative = get_narrative_by_id(article.narrative_id) if article.narrative_id else None
+    if narrative and article_id not in narrative.article_id_set:
+        narrative = None
     
     # Get article via narrative endpoint
     narrative_article_summary = None
     if narrative:
-        narrative_articles = []
         for aid in narrative.article_ids:
             a = get_article_by_id(aid)
             if a and a.id == article_id:
                 narrative_article_summary = article_to_summary(a)
                 break
     
+    # Dump each side's scores once and reuse for the response and the comparison
+    direct_scores = article.bias_scores.model_dump()
+    via_scores = narrative_article_summary.bias_scores.model_dump() if narrative_article_summary else None
+    
     return {
         "article_direct": {
             "id": article.id,
             "title": article.title,
-            "bias_scores": article.bias_scores.dict()
+            "bias_scores": direct_scores
         },
         "article_via_narrative": {
             "id": narrative_article_summary.id if narrative_article_summary else None,
             "title": narrative_article_summary.title if narrative_article_summary else None,
-            "bias_scores": narrative_article_summary.bias_scores.dict() if narrative_article_summary else None
+            "bias_scores": via_scores
         },
-        "scores_match": article.bias_scores.dict() == narrative_article_summary.bias_scores.dict() if narrative_article_summary else None,
+        "scores_match": direct_scores == via_scores if via_scores is not None else None,
         "narrative_id": narrative.id if narrative else None
     }
 
 if __name__ == "__main__":
+    # Local development entry point. For production, run under gunicorn instead:
+    # gunicorn -k uvicorn.workers.UvicornWorker -w <2n+1> main:app
+    # (uvicorn picks up uvloop/httptools automatically wherever they are installed)
     uvicorn.run("main:app", host="0.0.0.0", port=8000, reload=True)
\ No newline at end of file
@@ -1,7 +1,22 @@
 from models import Article, BiasScores, HighlightedPhrase, Narrative, TimePoint, ArticleSummary, NarrativeSummary
+from typing import Iterator, Optional
 from datetime import datetime, timedelta
+from operator import attrgetter
+from functools import lru_cache
+from collections import defaultdict
+import hashlib
+import os
+import pickle
 import random
-import uuid
+import sys
+import tempfile
+
+# Sort keys (attrgetter runs in C, unlike an equivalent lambda)
+_PUBLISHED_DATE = attrgetter("published_date")
+_LAST_UPDATED = attrgetter("last_updated")
+
+# Dedicated generator for mock data, kept separate from the global random state
+_RNG = random.Random()
 
 # Color scheme for bias highlighting
 BIAS_COLORS = {
@@ -24,106 +39,155 @@ NEWS_SOURCES = {
     "New York Times": {"ideological_stance": -20, "factual_grounding": 80, "emotional_tone": 30, "framing_choices": 35, "source_transparency": 75}
 }
 
-def create_bias_scores(source: str, topic_modifier: dict = None) -> BiasScores:
-    """Create realistic bias scores based on source and topic"""
-    base = NEWS_SOURCES.get(source, {"ideological_stance": 0, "factual_grounding": 75, "emotional_tone": 30, "framing_choices": 35, "source_transparency": 70})
-    
-    # Add some randomness
-    ideological_stance = base["ideological_stance"] + random.randint(-10, 10)
-    factual_grounding = max(0, min(100, base["factual_grounding"] + random.randint(-15, 15)))
-    emotional_tone = max(0, min(100, base["emotional_tone"] + random.randint(-10, 20)))
-    framing_choices = max(0, min(100, base["framing_choices"] + random.randint(-10, 15)))
-    source_transparency = max(0, min(100, base["source_transparency"] + random.randint(-10, 15)))
-    
-    # Apply topic modifiers if provided
-    if topic_modifier:
-        ideological_stance += topic_modifier.get("ideological_stance", 0)
-        emotional_tone += topic_modifier.get("emotional_tone", 0)
-        factual_grounding += topic_modifier.get("factual_grounding", 0)
-        framing_choices += topic_modifier.get("framing_choices", 0)
-        source_transparency += topic_modifier.get("source_transparency", 0)
+# Mock article URL prefix per source, built once rather than per article for known
+# sources (other sources fall back to building it on the fly)
+def _source_url_base(name: str) -> str:
+    return f"https://{name.lower().replace(' ', '')}.com/article/"
+
+_SOURCE_URL_BASE = {name: _source_url_base(name) for name in NEWS_SOURCES}
+
+# Per-source base scores unpacked once into tuples, in _BASE_DIMENSIONS order, so
+# scoring does one lookup per article instead of a dict-of-dicts walk
+_BASE_DIMENSIONS = ("ideological_stance", "factual_grounding", "emotional_tone", "framing_choices", "source_transparency")
+_SOURCE_BASES = {name: tuple(base[dim] for dim in _BASE_DIMENSIONS) for name, base in NEWS_SOURCES.items()}
+_DEFAULT_SOURCE_BASE = (0, 75, 30, 35, 70)
+
+def create_bias_scores_batch(specs: list[tuple[str, dict]]) -> list[BiasScores]:
+    """Create realistic bias scores for a batch of (source, topic_modifier) pairs"""
+    n = len(specs)
     
-    # Clamp values
-    ideological_stance = max(-100, min(100, ideological_stance))
-    emotional_tone = max(0, min(100, emotional_tone))
-    factual_grounding = max(0, min(100, factual_grounding))
-    framing_choices = max(0, min(100, framing_choices))
-    source_transparency = max(0, min(100, source_transparency))
+    # Draw the randomness for every article up front, one batched call per dimension
+    ideological_noise = _RNG.choices(range(-10, 11), k=n)
+    factual_noise = _RNG.choices(range(-15, 16), k=n)
+    emotional_noise = _RNG.choices(range(-10, 21), k=n)
+    framing_noise = _RNG.choices(range(-10, 16), k=n)
+    transparency_noise = _RNG.choices(range(-10, 16), k=n)
     
-    # Calculate overall bias score
-    overall = (abs(ideological_stance) + emotional_tone + (100 - factual_grounding) + framing_choices + (100 - source_transparency)) / 5
+    scores = []
+    for i, (source, topic_modifier) in enumerate(specs):
+        base_ideological, base_factual, base_emotional, base_framing, base_transparency = _SOURCE_BASES.get(source, _DEFAULT_SOURCE_BASE)
+        
+        # Add some randomness
+        ideological_stance = base_ideological + ideological_noise[i]
+        factual_grounding = max(0, min(100, base_factual + factual_noise[i]))
+        emotional_tone = max(0, min(100, base_emotional + emotional_noise[i]))
+        framing_choices = max(0, min(100, base_framing + framing_noise[i]))
+        source_transparency = max(0, min(100, base_transparency + transparency_noise[i]))
+        
+        # Apply topic modifiers if provided
+        if topic_modifier:
+            ideological_stance += topic_modifier.get("ideological_stance", 0)
+            emotional_tone += topic_modifier.get("emotional_tone", 0)
+            factual_grounding += topic_modifier.get("factual_grounding", 0)
+            framing_choices += topic_modifier.get("framing_choices", 0)
+            source_transparency += topic_modifier.get("source_transparency", 0)
+        
+        # Clamp values (unconditionally: the scores are built with model_construct,
+        # so nothing downstream validates the ranges)
+        ideological_stance = max(-100, min(100, ideological_stance))
+        emotional_tone = max(0, min(100, emotional_tone))
+        factual_grounding = max(0, min(100, factual_grounding))
+        framing_choices = max(0, min(100, framing_choices))
+        source_transparency = max(0, min(100, source_transparency))
+        
+        # Calculate overall bias score
+        overall = (abs(ideological_stance) + emotional_tone + (100 - factual_grounding) + framing_choices + (100 - source_transparency)) / 5
+        
+        # Values are clamped into range above, so skip validation; float() keeps the
+        # integer-valued dimensions typed as the model declares them
+        scores.append(BiasScores.model_construct(
+            overall=round(overall, 1),
+            ideological_stance=float(round(ideological_stance, 1)),
+            factual_grounding=float(round(factual_grounding, 1)),
+            framing_choices=float(round(framing_choices, 1)),
+            emotional_tone=float(round(emotional_tone, 1)),
+            source_transparency=float(round(source_transparency, 1))
+        ))
     
-    return BiasScores(
-        overall=round(overall, 1),
-        ideological_stance=round(ideological_stance, 1),
-        factual_grounding=round(factual_grounding, 1),
-        framing_choices=round(framing_choices, 1),
-        emotional_tone=round(emotional_tone, 1),
-        source_transparency=round(source_transparency, 1)
-    )
+    return scores
 
-def create_highlighted_phrases(content: str, bias_scores: BiasScores) -> list[HighlightedPhrase]:
-    """Generate realistic highlighted phrases based on content and bias"""
-    phrases = []
-    
+def create_bias_scores(source: str, topic_modifier: dict = None) -> BiasScores:
+    """Create realistic bias scores based on source and topic"""
+    return create_bias_scores_batch([(source, topic_modifier)])[0]
+
+# Candidate biased phrases per dimension
+BIAS_PHRASES = [
     # Ideological stance phrases
-    ideological_phrases = [
-        ("devastating blow", "ideological_stance"),
-        ("radical agenda", "ideological_stance"),
-        ("common-sense solution", "ideological_stance"),
-        ("extreme measures", "ideological_stance"),
-        ("failed policies", "ideological_stance")
-    ]
+    ("devastating blow", "ideological_stance"),
+    ("radical agenda", "ideological_stance"),
+    ("common-sense solution", "ideological_stance"),
+    ("extreme measures", "ideological_stance"),
+    ("failed policies", "ideological_stance"),
     
     # Emotional tone phrases
-    emotional_phrases = [
-        ("shocking revelation", "emotional_tone"),
-        ("catastrophic", "emotional_tone"),
-        ("unprecedented crisis", "emotional_tone"),
-        ("explosive", "emotional_tone"),
-        ("dramatic surge", "emotional_tone")
-    ]
+    ("shocking revelation", "emotional_tone"),
+    ("catastrophic", "emotional_tone"),
+    ("unprecedented crisis", "emotional_tone"),
+    ("explosive", "emotional_tone"),
+    ("dramatic surge", "emotional_tone"),
     
     # Factual grounding issues
-    factual_phrases = [
-        ("sources claim", "factual_grounding"),
-        ("allegedly", "factual_grounding"),
-        ("reportedly", "factual_grounding"),
-        ("critics argue", "factual_grounding")
-    ]
+    ("sources claim", "factual_grounding"),
+    ("allegedly", "factual_grounding"),
+    ("reportedly", "factual_grounding"),
+    ("critics argue", "factual_grounding"),
     
     # Framing choices
-    framing_phrases = [
-        ("under fire", "framing_choices"),
-        ("faces backlash", "framing_choices"),
-        ("controversial", "framing_choices"),
-        ("defended their position", "framing_choices")
-    ]
+    ("under fire", "framing_choices"),
+    ("faces backlash", "framing_choices"),
+    ("controversial", "framing_choices"),
+    ("defended their position", "framing_choices"),
     
     # Source transparency issues
-    transparency_phrases = [
-        ("anonymous sources", "source_transparency"),
-        ("unnamed officials", "source_transparency"),
-        ("according to reports", "source_transparency"),
-        ("leaked documents", "source_transparency")
-    ]
+    ("anonymous sources", "source_transparency"),
+    ("unnamed officials", "source_transparency"),
+    ("according to reports", "source_transparency"),
+    ("leaked documents", "source_transparency")
+]
+
+# Immutable search table resolved once at import:
+# (phrase_lower, phrase_text, phrase_length, bias_type, color).
+# bias_type is interned so every highlight shares one string object per dimension,
+# and the length and color are computed here instead of once per match.
+_ALL_PHRASES_LOWER = tuple(
+    (phrase_text.lower(), phrase_text, len(phrase_text), sys.intern(bias_type), BIAS_COLORS[bias_type])
+    for phrase_text, bias_type in BIAS_PHRASES
+)
+
+_MAX_HIGHLIGHTS = 5
+
+def _draw_confidences(k: int) -> list[float]:
+    """Draw k highlight confidences uniformly from [0.7, 0.95) in one batch"""
+    rand = _RNG.random
+    return [0.7 + 0.25 * rand() for _ in range(k)]
+
+def create_highlighted_phrases(content: str, bias_scores: BiasScores, confidences: Optional[Iterator[float]] = None) -> list[HighlightedPhrase]:
+    """Generate realistic highlighted phrases based on content and bias"""
+    phrases = []
     
-    all_phrases = ideological_phrases + emotional_phrases + factual_phrases + framing_phrases + transparency_phrases
+    # Callers generating many articles pass a pre-drawn confidence stream
+    if confidences is None:
+        confidences = iter(_draw_confidences(_MAX_HIGHLIGHTS))
     
-    for phrase_text, bias_type in all_phrases:
-        if phrase_text.lower() in content.lower():
-            start_pos = content.lower().find(phrase_text.lower())
-            if start_pos != -1:
-                phrases.append(HighlightedPhrase(
-                    text=phrase_text,
-                    start_pos=start_pos,
-                    end_pos=start_pos + len(phrase_text),
-                    bias_type=bias_type,
-                    confidence=random.uniform(0.7, 0.95),
-                    color=BIAS_COLORS[bias_type]
-                ))
+    # Lowercase the content once; find() returning -1 already signals a miss
+    content_lower = content.lower()
+    
+    for phrase_lower, phrase_text, phrase_length, bias_type, color in _ALL_PHRASES_LOWER:
+        start_pos = content_lower.find(phrase_lower)
+        if start_pos != -1:
+            phrases.append(HighlightedPhrase.model_construct(
+                text=phrase_text,
+                start_pos=start_pos,
+                end_pos=start_pos + phrase_length,
+                bias_type=bias_type,
+                confidence=next(confidences),
+                color=color
+            ))
+            # Limit to 5 highlights per article; skip scanning for the rest
+            if len(phrases) == _MAX_HIGHLIGHTS:
+                break
     
-    return phrases[:5]  # Limit to 5 highlights per article
+    return phrases
 
 # Sample article templates (updated with guaranteed bias phrases)
 ARTICLE_TEMPLATES = [
@@ -206,28 +270,44 @@ def generate_mock_articles() -> list[Article]:
     articles = []
     base_time = datetime.now() - timedelta(days=3)
     
+    # Score every article in one batch rather than one call per article
+    all_bias_scores = iter(create_bias_scores_batch([
+        (template["source"], template.get("topic_modifier"))
+        for narrative in ARTICLE_TEMPLATES
+        for template in narrative["articles"]
+    ]))
+    
+    # Pre-draw the remaining per-article randomness in batches
+    total_articles = sum(len(narrative["articles"]) for narrative in ARTICLE_TEMPLATES)
+    publish_jitter_hours = iter(_RNG.choices(range(0, 121), k=total_articles))
+    reporter_numbers = iter(_RNG.choices(range(1, 51), k=total_articles))
+    highlight_confidences = iter(_draw_confidences(total_articles * _MAX_HIGHLIGHTS))
+    
+    # Sequential mock IDs: unique within the dataset and stable across restarts
+    article_number = 0
+    
     for narrative in ARTICLE_TEMPLATES:
-        narrative_id = narrative["narrative_id"]
+        # Interned so every article shares one string object per narrative/source
+        narrative_id = sys.intern(narrative["narrative_id"])
         
         for i, template in enumerate(narrative["articles"]):
-            article_id = str(uuid.uuid4())
-            published_date = base_time + timedelta(hours=i*8 + random.randint(0, 120))
+            article_number += 1
+            article_id = f"art-{narrative_id}-{article_number:04d}"
+            published_date = base_time + timedelta(hours=i*8 + next(publish_jitter_hours))
             
-            bias_scores = create_bias_scores(
-                template["source"], 
-                template.get("topic_modifier")
-            )
+            bias_scores = next(all_bias_scores)
             
-            highlighted_phrases = create_highlighted_phrases(template["content"], bias_scores)
+            highlighted_phrases = create_highlighted_phrases(template["content"], bias_scores, highlight_confidences)
             
-            article = Article(
+            # Trusted generated fields: skip Pydantic validation
+            article = Article.model_construct(
                 id=article_id,
                 title=template["title"],
                 content=template["content"],
-                source=template["source"],
-                author=f"Reporter {random.randint(1, 50)}",
+                source=sys.intern(template["source"]),
+                author=f"Reporter {next(reporter_numbers)}",
                 published_date=published_date,
-                url=f"https://{template['source'].lower().replace(' ', '')}.com/article/{article_id[:8]}",
+                url=(_SOURCE_URL_BASE.get(template["source"]) or _source_url_base(template["source"])) + article_id,
                 bias_scores=bias_scores,
                 highlighted_phrases=highlighted_phrases,
                 narrative_id=narrative_id
@@ -237,6 +317,66 @@ def generate_mock_articles() -> list[Article]:
     
     return articles
 
+def _build_narrative(narrative_id: str, info: dict, narrative_articles: list[Article]) -> Narrative:
+    """Build a single narrative from its (non-empty) bucket of articles"""
+    # Sort once by publication date: the ends give the date range and the
+    # sorted order drives the bias evolution timeline
+    sorted_articles = sorted(narrative_articles, key=_PUBLISHED_DATE)
+    created_date = sorted_articles[0].published_date
+    last_updated = sorted_articles[-1].published_date
+    
+    # Single pass: accumulate all bias dimensions together
+    sum_overall = sum_ideological = sum_factual = sum_framing = sum_emotional = sum_transparency = 0.0
+    for article in narrative_articles:
+        scores = article.bias_scores
+        sum_overall += scores.overall
+        sum_ideological += scores.ideological_stance
+        sum_factual += scores.factual_grounding
+        sum_framing += scores.framing_choices
+        sum_emotional += scores.emotional_tone
+        sum_transparency += scores.source_transparency
+    
+    # Average bias scores across all 5 dimensions
+    n = len(narrative_articles)
+    avg_overall = sum_overall / n
+    avg_ideological = sum_ideological / n
+    avg_factual = sum_factual / n
+    avg_framing = sum_framing / n
+    avg_emotional = sum_emotional / n
+    avg_transparency = sum_transparency / n
+    
+    avg_bias_scores = BiasScores.model_construct(
+        overall=round(avg_overall, 1),
+        ideological_stance=round(avg_ideological, 1),
+        factual_grounding=round(avg_factual, 1),
+        framing_choices=round(avg_framing, 1),
+        emotional_tone=round(avg_emotional, 1),
+        source_transparency=round(avg_transparency, 1)
+    )
+    
+    # Create bias evolution timeline
+    bias_evolution = [
+        TimePoint.model_construct(
+            timestamp=article.published_date,
+            bias_scores=article.bias_scores,
+            article_count=i
+        )
+        for i, article in enumerate(sorted_articles, 1)
+    ]
+    
+    return Narrative.model_construct(
+        id=narrative_id,
+        title=info["title"],
+        description=info["description"],
+        article_ids=[a.id for a in narrative_articles],
+        dominant_framing=info["dominant_framing"],
+        article_count=n,
+        avg_bias_scores=avg_bias_scores,
+        created_date=created_date,
+        last_updated=last_updated,
+        bias_evolution=bias_evolution
+    )
+
 def generate_mock_narratives(articles: list[Article]) -> list[Narrative]:
     """Generate narrative clusters from articles"""
     narratives = []
@@ -259,74 +399,150 @@ def generate_mock_narratives(articles: list[Article]) -> list[Narrative]:
         }
     }
     
+    # Bucket articles by narrative in one pass instead of re-scanning per narrative
+    articles_by_narrative = defaultdict(list)
+    for article in articles:
+        articles_by_narrative[article.narrative_id].append(article)
+    
     for narrative_id, info in narrative_info.items():
-        narrative_articles = [a for a in articles if a.narrative_id == narrative_id]
+        narrative_articles = articles_by_narrative.get(narrative_id, [])
         
         if not narrative_articles:
             continue
-            
-        # Calculate average bias scores across all 5 dimensions
-        avg_overall = sum(a.bias_scores.overall for a in narrative_articles) / len(narrative_articles)
-        avg_ideological = sum(a.bias_scores.ideological_stance for a in narrative_articles) / len(narrative_articles)
-        avg_factual = sum(a.bias_scores.factual_grounding for a in narrative_articles) / len(narrative_articles)
-        avg_framing = sum(a.bias_scores.framing_choices for a in narrative_articles) / len(narrative_articles)
-        avg_emotional = sum(a.bias_scores.emotional_tone for a in narrative_articles) / len(narrative_articles)
-        avg_transparency = sum(a.bias_scores.source_transparency for a in narrative_articles) / len(narrative_articles)
         
-        avg_bias_scores = BiasScores(
-            overall=round(avg_overall, 1),
-            ideological_stance=round(avg_ideological, 1),
-            factual_grounding=round(avg_factual, 1),
-            framing_choices=round(avg_framing, 1),
-            emotional_tone=round(avg_emotional, 1),
-            source_transparency=round(avg_transparency, 1)
-        )
-        
-        # Create bias evolution timeline
-        bias_evolution = []
-        for i, article in enumerate(sorted(narrative_articles, key=lambda x: x.published_date)):
-            bias_evolution.append(TimePoint(
-                timestamp=article.published_date,
-                bias_scores=article.bias_scores,
-                article_count=i + 1
-            ))
-        
-        narrative = Narrative(
-            id=narrative_id,
-            title=info["title"],
-            description=info["description"],
-            article_ids=[a.id for a in narrative_articles],
-            dominant_framing=info["dominant_framing"],
-            article_count=len(narrative_articles),
-            avg_bias_scores=avg_bias_scores,
-            created_date=min(a.published_date for a in narrative_articles),
-            last_updated=max(a.published_date for a in narrative_articles),
-            bias_evolution=bias_evolution
-        )
-        
-        narratives.append(narrative)
+        narratives.append(_build_narrative(narrative_id, info, narrative_articles))
     
     return narratives
 
-# Global data storage (in-memory for prototype)
-MOCK_ARTICLES = generate_mock_articles()
-MOCK_NARRATIVES = generate_mock_narratives(MOCK_ARTICLES)
+# Optional on-disk cache of the generated dataset for faster cold starts. Opt in by
+# setting BIAS_LABS_MOCK_CACHE to a file path; delete the file to regenerate. Cached
+# data keeps the publish dates from when it was generated, and only point this at a
+# file this service wrote itself (it is unpickled).
+MOCK_CACHE_PATH = os.environ.get("BIAS_LABS_MOCK_CACHE")
+
+# Bump when the cache layout changes. The tag also hashes the model and generator
+# sources, so editing either invalidates old caches instead of loading stale models.
+_MOCK_CACHE_FORMAT = 1
+
+def _mock_cache_tag() -> str:
+    digest = hashlib.blake2b(digest_size=8)
+    for path in (sys.modules[Article.__module__].__file__, __file__):
+        with open(path, "rb") as f:
+            digest.update(f.read())
+    return f"{_MOCK_CACHE_FORMAT}:{digest.hexdigest()}"
+
+def _load_mock_cache(path: str, tag: str) -> Optional[tuple[list[Article], list[Narrative]]]:
+    """Return cached data, or None if the file is missing, unreadable or stale"""
+    try:
+        with open(path, "rb") as f:
+            # The tag is pickled separately ahead of the data, so a stale cache is
+            # rejected before unpickling any model instances
+            if pickle.load(f) != tag:
+                return None
+            return pickle.load(f)
+    except (OSError, EOFError, pickle.UnpicklingError):
+        return None
+
+def _write_mock_cache(path: str, tag: str, data: tuple[list[Article], list[Narrative]]) -> None:
+    """Write the cache atomically: concurrent workers only ever see a complete file"""
+    try:
+        fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(path) or ".", suffix=".tmp")
+    except OSError:
+        # Unwritable or missing directory: the cache is an optimization, so skip it
+        return
+    try:
+        with os.fdopen(fd, "wb") as f:
+            pickle.dump(tag, f)
+            pickle.dump(data, f)
+        os.replace(tmp_path, path)
+    except OSError:
+        try:
+            os.unlink(tmp_path)
+        except OSError:
+            pass
+
+# Global data storage (in-memory for prototype). Generated lazily on first access and
+# memoized, so importing this module is cheap and generation happens once per process.
+@lru_cache(maxsize=1)
+def _get_mock_data() -> tuple[list[Article], list[Narrative]]:
+    if MOCK_CACHE_PATH:
+        tag = _mock_cache_tag()
+        cached = _load_mock_cache(MOCK_CACHE_PATH, tag)
+        if cached is not None:
+            return cached
+    
+    articles = generate_mock_articles()
+    narratives = generate_mock_narratives(articles)
+    
+    if MOCK_CACHE_PATH:
+        _write_mock_cache(MOCK_CACHE_PATH, tag, (articles, narratives))
+    
+    return articles, narratives
+
+def _get_articles() -> list[Article]:
+    return _get_mock_data()[0]
+
+def _get_narratives() -> list[Narrative]:
+    return _get_mock_data()[1]
+
+# Module-level MOCK_ARTICLES / MOCK_NARRATIVES resolved on first access (PEP 562), so
+# code reading them directly keeps working without forcing generation at import
+_LAZY_GLOBALS = {"MOCK_ARTICLES": _get_articles, "MOCK_NARRATIVES": _get_narratives}
+
+def __getattr__(name: str):
+    loader = _LAZY_GLOBALS.get(name)
+    if loader is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = globals()[name] = loader()
+    return value
+
+# ID indexes for O(1) detail lookups
+@lru_cache(maxsize=1)
+def _get_articles_by_id() -> dict[str, Article]:
+    return {a.id: a for a in _get_articles()}
+
+@lru_cache(maxsize=1)
+def _get_narratives_by_id() -> dict[str, Narrative]:
+    return {n.id: n for n in _get_narratives()}
+
+# Listing orders (most recent first), sorted once since the mock data never changes
+@lru_cache(maxsize=1)
+def _get_articles_by_date_desc() -> list[Article]:
+    return sorted(_get_articles(), key=_PUBLISHED_DATE, reverse=True)
+
+@lru_cache(maxsize=1)
+def _get_narratives_by_updated_desc() -> list[Narrative]:
+    return sorted(_get_narratives(), key=_LAST_UPDATED, reverse=True)
+
+# Articles grouped by narrative, built once so narrative listings skip a full scan.
+# Filled from the date-sorted list so each bucket is already most-recent-first.
+@lru_cache(maxsize=1)
+def _get_articles_by_narrative() -> dict[str, list[Article]]:
+    articles_by_narrative: dict[str, list[Article]] = {}
+    for article in _get_articles_by_date_desc():
+        articles_by_narrative.setdefault(article.narrative_id, []).append(article)
+    return articles_by_narrative
 
 # Helper functions for API endpoints
 def get_all_articles() -> list[Article]:
-    return MOCK_ARTICLES
+    return _get_articles()
+
+def get_recent_articles() -> list[Article]:
+    """All articles, most recently published first"""
+    return _get_articles_by_date_desc()
 
-def get_article_by_id(article_id: str) -> Article:
-    for article in MOCK_ARTICLES:
-        if article.id == article_id:
-            return article
-    return None
+def get_article_by_id(article_id: str) -> Optional[Article]:
+    return _get_articles_by_id().get(article_id)
+
+def get_articles_by_narrative_id(narrative_id: str) -> list[Article]:
+    return _get_articles_by_narrative().get(narrative_id, [])
 
 def get_all_narratives() -> list[Narrative]:
-    return MOCK_NARRATIVES
+    return _get_narratives()
+
+def get_recent_narratives() -> list[Narrative]:
+    """All narratives, most recently updated first"""
+    return _get_narratives_by_updated_desc()
 
-def get_narrative_by_id(narrative_id: str) -> Narrative:
-    for narrative in MOCK_NARRATIVES:
-        if narrative.id == narrative_id:
-            return narrative
-    return None
\ No newline at end of file
+def get_narrative_by_id(narrative_id: str) -> Optional[Narrative]:
+    return _get_narratives_by_id().get(narrative_id)
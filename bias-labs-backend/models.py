@@ -1,9 +1,15 @@
-from pydantic import BaseModel, Field
-from typing import List, Optional, Dict
+from pydantic import BaseModel, ConfigDict, Field
+from typing import List, Optional, Dict, FrozenSet
+from functools import cached_property
 from datetime import datetime
 from enum import Enum
 
+# All models are immutable once built: the mock data is static and the API layer
+# caches projections of it (summaries, stats), so nothing may mutate them in place.
+_FROZEN = ConfigDict(frozen=True)
+
 class BiasScores(BaseModel):
+    model_config = _FROZEN
     overall: float = Field(..., ge=0, le=100, description="Overall bias score 0-100")
     ideological_stance: float = Field(..., ge=-100, le=100, description="Ideological stance -100 (left) to 100 (right)")
     factual_grounding: float = Field(..., ge=0, le=100, description="Factual accuracy and evidence-based reporting score")
@@ -12,6 +18,7 @@ class BiasScores(BaseModel):
     source_transparency: float = Field(..., ge=0, le=100, description="Source attribution and transparency score")
 
 class HighlightedPhrase(BaseModel):
+    model_config = _FROZEN
     text: str = Field(..., description="The biased phrase")
     start_pos: int = Field(..., description="Starting position in text")
     end_pos: int = Field(..., description="Ending position in text")
@@ -20,6 +27,7 @@ class HighlightedPhrase(BaseModel):
     color: str = Field(..., description="Hex color for highlighting")
 
 class Article(BaseModel):
+    model_config = _FROZEN
     id: str = Field(..., description="Unique article identifier")
     title: str = Field(..., description="Article headline")
     content: str = Field(..., description="Article body text")
@@ -33,6 +41,7 @@ class Article(BaseModel):
 
 class ArticleSummary(BaseModel):
     """Lightweight version for article lists"""
+    model_config = _FROZEN
     id: str
     title: str
     source: str
@@ -41,11 +50,13 @@ class ArticleSummary(BaseModel):
     narrative_id: Optional[str] = None
 
 class TimePoint(BaseModel):
+    model_config = _FROZEN
     timestamp: datetime = Field(..., description="Point in time")
     bias_scores: BiasScores = Field(..., description="Bias scores at this time")
     article_count: int = Field(..., description="Number of articles at this point")
 
 class Narrative(BaseModel):
+    model_config = _FROZEN
     id: str = Field(..., description="Unique narrative identifier")
     title: str = Field(..., description="Narrative title")
     description: str = Field(..., description="Brief description of the story framing")
@@ -57,8 +68,14 @@ class Narrative(BaseModel):
     last_updated: datetime = Field(..., description="Most recent article added")
     bias_evolution: List[TimePoint] = Field(default=[], description="How bias changed over time")
 
+    @cached_property
+    def article_id_set(self) -> FrozenSet[str]:
+        """Article IDs as a frozenset for O(1) membership checks"""
+        return frozenset(self.article_ids)
+
 class NarrativeSummary(BaseModel):
     """Lightweight version for narrative lists"""
+    model_config = _FROZEN
     id: str
     title: str
     description: str